@@ -2,16 +2,48 @@
 Command-line interface for the symbolic differentiator.
 
 This module provides a command-line interface for the symbolic differentiator.
+It is the entry point of every ``symdiff`` process, so it keeps its own import
+footprint small: ``argparse`` is only loaded when the arguments are not a plain
+expression/variable pair, and the differentiation machinery is only loaded once
+there is an expression to differentiate.
 """
 
-import argparse
 import sys
 
-from symdiff.core import differentiate
 
+def parse_args_fast(argv: list[str]) -> tuple[str | None, str] | None:
+    """Parse the common ``EXPRESSION [-v VARIABLE]`` form without argparse.
+
+    Returns ``None`` for anything else (help, unknown options, expressions that
+    look like options, ...) so the caller can fall back to the full parser.
+    """
+    expression = None
+    variable = "x"
+    i = 0
+
+    while i < len(argv):
+        arg = argv[i]
+        if arg in ("-v", "--variable"):
+            if i + 1 >= len(argv) or argv[i + 1].startswith("-"):
+                return None
+            variable = argv[i + 1]
+            i += 2
+        elif arg.startswith("--variable="):
+            variable = arg.split("=", 1)[1]
+            i += 1
+        elif arg.startswith("-") or expression is not None:
+            return None
+        else:
+            expression = arg
+            i += 1
+
+    return expression, variable
+
+
+def parse_args(argv: list[str]) -> tuple[str | None, str]:
+    """Parse command-line arguments with argparse."""
+    import argparse
 
-def cli() -> None:
-    """Run the command-line interface for the symbolic differentiator."""
     parser = argparse.ArgumentParser(
         description="Symbolic Differentiator for Polynomial Expressions"
     )
@@ -27,20 +59,30 @@ def cli() -> None:
         help="Variable to differentiate with respect to (default: x)",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    return args.expression, args.variable
+
 
-    if not args.expression:
+def cli() -> None:
+    """Run the command-line interface for the symbolic differentiator."""
+    argv = sys.argv[1:]
+    parsed = parse_args_fast(argv)
+    expression, variable = parsed if parsed is not None else parse_args(argv)
+
+    if not expression:
         if not sys.stdin.isatty():
-            process_stdin(args.variable)
+            process_stdin(variable)
         else:
-            run_interactive_mode(args.variable)
+            run_interactive_mode(variable)
         return
     else:
-        process_expression(args.expression, args.variable)
+        process_expression(expression, variable)
 
 
 def process_stdin(variable: str) -> None:
     """Process expressions from standard input."""
+    from symdiff.core import differentiate
+
     for line in sys.stdin:
         line = line.strip()
         if not line or line.lower() in ("q", "quit", "exit"):
@@ -54,6 +96,8 @@ def process_stdin(variable: str) -> None:
 
 def run_interactive_mode(variable: str) -> None:
     """Run an interactive session for entering expressions."""
+    from symdiff.core import differentiate
+
     print("Symbolic Differentiator for Polynomial Expressions")
     print("=" * 50)
     print("Enter an expression to differentiate (or 'q' to quit):")
@@ -78,6 +122,8 @@ def run_interactive_mode(variable: str) -> None:
 
 def process_expression(expression: str, variable: str) -> None:
     """Process a single expression from command line arguments."""
+    from symdiff.core import differentiate
+
     try:
         result = differentiate(expression, variable)
         print(f"d/d{variable}({expression}) = {result}")
@@ -2,27 +2,49 @@
 Core functionality for symbolic differentiation.
 
 This module contains the core functions for symbolic differentiation,
-including differentiation and formatting.
+including differentiation, formatting and lazily evaluated derivatives.
 """
 
-import re
-from typing import Callable, Match
+from collections.abc import Callable, Iterator
+from functools import cache
 
 from symdiff.expressions import (
+    Constant,
     CustomExpression,
     Expression,
+    Negation,
+    Number,
+    Sum,
 )
 from symdiff.parser import parse_expression
 
+# Importing ``typing`` would add noticeably to CLI start-up, so it is only
+# imported by type checkers, which treat this name like ``typing.TYPE_CHECKING``.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Literal, overload
 
-def format_result(expr: Expression) -> Expression:
-    """Format the result for better readability."""
-    result_str = str(expr).replace("+ -", " - ")
 
-    while "  " in result_str:
-        result_str = result_str.replace("  ", " ")
+@cache
+def coefficient_rewriter() -> Callable[[str], str]:
+    """Build the function that folds and tidies coefficients in a result string.
+
+    ``re`` is imported and the patterns compiled on first use only, so results
+    that need no rewriting never pay for them.
+    """
+    import re
 
-    def float_multiply_handler(match: Match) -> str:
+    float_multiply_patterns = [
+        re.compile(r"(\d+\.\d+)\*(\d+)\*([a-zA-Z])"),
+        re.compile(r"(\d+)\*(\d+\.\d+)\*([a-zA-Z])"),
+        re.compile(r"(\d+\.\d+)\*(\d+\.\d+)\*([a-zA-Z])"),
+    ]
+    int_multiply_pattern = re.compile(r"(\d+)\*(\d+)\*([a-zA-Z])")
+    negative_factor_pattern = re.compile(r"(\d+(?:\.\d+)?)\*-")
+    unit_float_factor_pattern = re.compile(r"(?<![0-9])1\.0\*")
+    unit_int_factor_pattern = re.compile(r"(?<![0-9])1\*")
+
+    def float_multiply_handler(match: re.Match[str]) -> str:
         num1 = float(match.group(1))
         num2 = float(match.group(2))
         var = match.group(3)
@@ -31,39 +53,155 @@ def format_result(expr: Expression) -> Expression:
             result = int(result)
         return f"{result}*{var}"
 
-    patterns = [
-        r"(\d+\.\d+)\*(\d+)\*([a-zA-Z])",
-        r"(\d+)\*(\d+\.\d+)\*([a-zA-Z])",
-        r"(\d+\.\d+)\*(\d+\.\d+)\*([a-zA-Z])",
-    ]
+    def int_multiply_handler(match: re.Match[str]) -> str:
+        return f"{int(match.group(1)) * int(match.group(2))}*{match.group(3)}"
+
+    def rewrite(result_str: str) -> str:
+        for pattern in float_multiply_patterns:
+            result_str = pattern.sub(float_multiply_handler, result_str)
 
-    for pattern in patterns:
-        result_str = re.sub(pattern, float_multiply_handler, result_str)
+        result_str = int_multiply_pattern.sub(int_multiply_handler, result_str)
 
-    int_multiply_handler: Callable[[Match], str] = (
-        lambda m: f"{int(m.group(1)) * int(m.group(2))}*{m.group(3)}"
-    )
-    result_str = re.sub(
-        r"(\d+)\*(\d+)\*([a-zA-Z])",
-        int_multiply_handler,
-        result_str,
-    )
+        result_str = negative_factor_pattern.sub(r"-\1*", result_str)
 
-    result_str = re.sub(r"(\d+(?:\.\d+)?)\*-", r"-\1*", result_str)
+        result_str = result_str.replace("-1*", "-")
 
-    result_str = result_str.replace("-1*", "-")
+        result_str = unit_float_factor_pattern.sub("", result_str)
+        return unit_int_factor_pattern.sub("", result_str)
+
+    return rewrite
+
+
+def format_result(expr: Expression) -> Expression:
+    """Format the result for better readability."""
+    expr_str = str(expr)
+    result_str = expr_str.replace("+ -", " - ")
+
+    while "  " in result_str:
+        result_str = result_str.replace("  ", " ")
 
-    result_str = re.sub(r"(?<![0-9])1\.0\*", "", result_str)
-    result_str = re.sub(r"(?<![0-9])1\*", "", result_str)
+    # Every coefficient rewrite targets a ``*``; plain sums and powers skip them.
+    if "*" in result_str:
+        result_str = coefficient_rewriter()(result_str)
 
-    if result_str != str(expr):
+    if result_str != expr_str:
         return CustomExpression(expr, result_str)
 
     return expr
 
 
-def differentiate(expression_str: str, variable: str = "x") -> Expression:
-    """Differentiate a polynomial expression with respect to a variable."""
+class LazyDerivative:
+    """A derivative whose terms are differentiated and rendered on demand.
+
+    Each term of the parsed expression is differentiated and simplified the
+    first time it is needed, so queries such as ``is_zero`` stop as soon as the
+    answer is known and never build or format the full result.
+    """
+
+    def __init__(self, expr: Expression, variable: str) -> None:
+        self.variable = variable
+        self.terms = expr.terms if isinstance(expr, Sum) else [expr]
+        self._derivatives: list[Expression | None] = [None] * len(self.terms)
+        self._expression: Expression | None = None
+        self._str: str | None = None
+
+    def term(self, index: int) -> Expression:
+        """Return the simplified derivative of a single term."""
+        derivative = self._derivatives[index]
+        if derivative is None:
+            derivative = self.terms[index].differentiate(self.variable).simplify()
+            self._derivatives[index] = derivative
+        return derivative
+
+    def _nonzero_terms(self) -> Iterator[Expression]:
+        """Yield the non-zero terms of the derivative, one term at a time."""
+
+        def flatten(expr: Expression) -> Iterator[Expression]:
+            if isinstance(expr, Sum):
+                for term in expr.terms:
+                    yield from flatten(term)
+            elif isinstance(expr, Negation) and isinstance(expr.expression, Sum):
+                for term in flatten(expr.expression):
+                    yield Negation(term)
+            elif not (isinstance(expr, Constant) and expr.value == 0):
+                yield expr
+
+        for index in range(len(self.terms)):
+            yield from flatten(self.term(index))
+
+    @property
+    def is_zero(self) -> bool:
+        """Whether every rendered term of the derivative is zero.
+
+        Like terms are not combined, so a derivative that only cancels out
+        mathematically, such as ``1 - 1`` for ``x - x``, is not zero.
+        """
+        return next(self._nonzero_terms(), None) is None
+
+    @property
+    def degree(self) -> Number | None:
+        """The highest degree among the rendered terms, or None if there are none.
+
+        Like terms are not combined, so terms that cancel out still count:
+        ``x^2 - x^2`` gives ``2*x - 2*x`` with degree 1.
+        """
+        degree = max(
+            map(lambda term: term.degree(self.variable), self._nonzero_terms()),
+            default=None,
+        )
+        if degree is None:
+            return None
+        return int(degree) if degree == int(degree) else degree
+
+    @property
+    def term_count(self) -> int:
+        """The number of non-zero terms in the derivative."""
+        return sum(1 for _ in self._nonzero_terms())
+
+    @property
+    def expression(self) -> Expression:
+        """The fully simplified and formatted derivative."""
+        if self._expression is None:
+            derivatives = list(map(self.term, range(len(self.terms))))
+            self._expression = format_result(Sum(derivatives).simplify())
+        return self._expression
+
+    def __str__(self) -> str:
+        """Render the derivative, caching the string after the first call."""
+        if self._str is None:
+            self._str = str(self.expression)
+        return self._str
+
+
+if TYPE_CHECKING:
+
+    @overload
+    def differentiate(
+        expression_str: str, variable: str = "x", *, lazy: Literal[False] = False
+    ) -> Expression: ...
+
+    @overload
+    def differentiate(
+        expression_str: str, variable: str = "x", *, lazy: Literal[True]
+    ) -> LazyDerivative: ...
+
+    @overload
+    def differentiate(
+        expression_str: str, variable: str = "x", *, lazy: bool = False
+    ) -> Expression | LazyDerivative: ...
+
+
+def differentiate(
+    expression_str: str, variable: str = "x", *, lazy: bool = False
+) -> Expression | LazyDerivative:
+    """Differentiate a polynomial expression with respect to a variable.
+
+    With ``lazy=True`` the expression is parsed immediately, so invalid input
+    still raises ``ValueError``, but a ``LazyDerivative`` is returned instead of
+    the simplified and formatted derivative.
+    """
     expr = parse_expression(expression_str, variable)
+    if lazy:
+        return LazyDerivative(expr, variable)
     derivative = expr.differentiate(variable).simplify()
     return format_result(derivative)
@@ -5,15 +5,33 @@ This module contains the classes that represent mathematical expressions
 for symbolic differentiation.
 """
 
-from dataclasses import dataclass
 from functools import reduce
 
 Number = int | float
 
 
-@dataclass
 class Expression:
-    """Base class for all expressions."""
+    """Base class for all expressions.
+
+    Subclasses list their attributes in ``fields``, which drives equality and
+    ``repr``. These are plain classes rather than dataclasses because importing
+    ``dataclasses`` dominates the start-up time of the command-line tool.
+    """
+
+    fields: tuple[str, ...] = ()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __eq__(self, other: object) -> bool:
+        """Compare expressions of the same class field by field."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.fields)
+
+    def __repr__(self) -> str:
+        """Represent the expression by its class name and fields."""
+        args = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.fields)
+        return f"{self.__class__.__qualname__}({args})"
 
     def differentiate(self, variable: str) -> "Expression":
         """Differentiate the expression with respect to the given variable."""
@@ -23,17 +41,27 @@ class Expression:
         """Simplify the expression."""
         return self
 
+    def degree(self, variable: str) -> Number:
+        """Return the degree of the expression in the given variable."""
+        raise NotImplementedError("Subclasses must implement this method")
+
 
-@dataclass
 class Constant(Expression):
     """Represents a constant value."""
 
-    value: Number
+    fields = ("value",)
+
+    def __init__(self, value: Number) -> None:
+        self.value = value
 
     def differentiate(self, variable: str) -> Expression:
         """Differentiate a constant (always returns 0)."""
         return Constant(0)
 
+    def degree(self, variable: str) -> Number:
+        """Return the degree of a constant (always 0)."""
+        return 0
+
     def __str__(self) -> str:
         """Convert to string, using integer form when possible."""
         return (
@@ -41,27 +69,35 @@ class Constant(Expression):
         )
 
 
-@dataclass
 class Variable(Expression):
     """Represents a variable."""
 
-    name: str
+    fields = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
 
     def differentiate(self, variable: str) -> Expression:
         """Differentiate a variable (returns 1 if same variable, 0 otherwise)."""
         return Constant(1) if self.name == variable else Constant(0)
 
+    def degree(self, variable: str) -> Number:
+        """Return the degree of a variable (1 if same variable, 0 otherwise)."""
+        return 1 if self.name == variable else 0
+
     def __str__(self) -> str:
         """Convert to string (returns the variable name)."""
         return self.name
 
 
-@dataclass
 class Power(Expression):
     """Represents a variable raised to a power: x^n."""
 
-    variable: Variable
-    exponent: Number
+    fields = ("variable", "exponent")
+
+    def __init__(self, variable: Variable, exponent: Number) -> None:
+        self.variable = variable
+        self.exponent = exponent
 
     def differentiate(self, variable: str) -> Expression:
         """Differentiate a power expression using the power rule."""
@@ -77,6 +113,10 @@ class Power(Expression):
                 [Constant(self.exponent), Power(self.variable, self.exponent - 1)]
             ).simplify()
 
+    def degree(self, variable: str) -> Number:
+        """Return the exponent if the base is the given variable, 0 otherwise."""
+        return self.exponent if self.variable.name == variable else 0
+
     def __str__(self) -> str:
         """Convert to string, handling special cases for exponents 0 and 1."""
         if self.exponent == 0:
@@ -100,16 +140,22 @@ class Power(Expression):
         return self
 
 
-@dataclass
 class Negation(Expression):
     """Represents the negation of an expression: -expr."""
 
-    expression: Expression
+    fields = ("expression",)
+
+    def __init__(self, expression: Expression) -> None:
+        self.expression = expression
 
     def differentiate(self, variable: str) -> Expression:
         """Differentiate a negation using the rule: (-f(x))' = -f'(x)."""
         return Negation(self.expression.differentiate(variable))
 
+    def degree(self, variable: str) -> Number:
+        """Return the degree of the negated expression."""
+        return self.expression.degree(variable)
+
     def __str__(self) -> str:
         """Convert to string, adding parentheses around sums."""
         return (
@@ -132,11 +178,13 @@ class Negation(Expression):
         return Negation(simplified_expr)
 
 
-@dataclass
 class Sum(Expression):
     """Represents a sum of expressions."""
 
-    terms: list[Expression]
+    fields = ("terms",)
+
+    def __init__(self, terms: list[Expression]) -> None:
+        self.terms = terms
 
     def differentiate(self, variable: str) -> Expression:
         """Differentiate a sum using the rule: (f+g)' = f'+g'."""
@@ -145,6 +193,10 @@ class Sum(Expression):
         )
         return Sum(list(derivatives)).simplify()
 
+    def degree(self, variable: str) -> Number:
+        """Return the highest degree among the terms."""
+        return max(map(lambda term: term.degree(variable), self.terms), default=0)
+
     def __str__(self) -> str:
         """Convert to string, joining terms with +."""
         return " + ".join(map(str, self.terms))
@@ -166,11 +218,13 @@ class Sum(Expression):
         return Sum(non_zero_terms)
 
 
-@dataclass
 class Product(Expression):
     """Represents a product of expressions."""
 
-    factors: list[Expression]
+    fields = ("factors",)
+
+    def __init__(self, factors: list[Expression]) -> None:
+        self.factors = factors
 
     def differentiate(self, variable: str) -> Expression:
         """Differentiate a product using the product rule."""
@@ -201,6 +255,10 @@ class Product(Expression):
 
         return Sum(result_terms).simplify()
 
+    def degree(self, variable: str) -> Number:
+        """Return the degree of a product (the sum of the factor degrees)."""
+        return sum(map(lambda factor: factor.degree(variable), self.factors))
+
     def __str__(self) -> str:
         """Convert to string, handling special cases for 0 and 1."""
         if any(isinstance(f, Constant) and f.value == 0 for f in self.factors):
@@ -289,17 +347,23 @@ class Product(Expression):
         return Product(non_one_factors)
 
 
-@dataclass
 class CustomExpression(Expression):
     """A wrapper for expressions with custom string representation."""
 
-    expr: Expression
-    custom_str: str
+    fields = ("expr", "custom_str")
+
+    def __init__(self, expr: Expression, custom_str: str) -> None:
+        self.expr = expr
+        self.custom_str = custom_str
 
     def differentiate(self, variable: str) -> Expression:
         """Delegate differentiation to the wrapped expression."""
         return self.expr.differentiate(variable)
 
+    def degree(self, variable: str) -> Number:
+        """Delegate the degree to the wrapped expression."""
+        return self.expr.degree(variable)
+
     def __str__(self) -> str:
         """Return the custom string representation."""
         return self.custom_str
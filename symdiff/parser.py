@@ -5,7 +5,6 @@ This module contains functions for parsing mathematical expressions
 into expression objects.
 """
 
-import re
 from functools import partial
 
 from symdiff.expressions import (
@@ -62,7 +61,7 @@ def parse_expression(expression_str: str, variable: str = "x") -> Expression:
     """Parse a polynomial expression string into an Expression object."""
 
     expression_str = expression_str.replace(" ", "")
-    expression_str = re.sub(r"(?<!\^)-", "+-", expression_str)
+    expression_str = expression_str.replace("-", "+-").replace("^+-", "^-")
 
     if expression_str.startswith("+"):
         expression_str = expression_str[1:]
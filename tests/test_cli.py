@@ -0,0 +1,97 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import symdiff
+from symdiff.cli import cli, parse_args, parse_args_fast
+
+# Set SYMDIFF_IMPORT_TIME_BUDGET_US to override the budget, or to 0 to skip the
+# timing check on slow or heavily loaded machines.
+IMPORT_TIME_BUDGET_US = int(os.environ.get("SYMDIFF_IMPORT_TIME_BUDGET_US", 40_000))
+IMPORT_TIME_RUNS = 5
+REPO_ROOT = Path(symdiff.__file__).parent.parent
+AVOIDED_MODULES = ("argparse", "dataclasses", "inspect", "typing")
+START_MARKER = "symdiff-cli-start"
+
+
+def cli_import_times(*args: str) -> dict[str, int]:
+    """Run the CLI once and return the cumulative import cost (in us) of each
+    module it imports, ignoring imports made by interpreter start-up."""
+    code = (
+        "import sys; "
+        f"sys.stderr.write({START_MARKER!r} + '\\n'); "
+        f"sys.argv = ['symdiff', *{list(args)!r}]; "
+        "from symdiff.cli import cli; "
+        "cli()"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=REPO_ROOT,
+    )
+    lines = result.stderr.splitlines()
+    times = {}
+    for line in lines[lines.index(START_MARKER) + 1 :]:
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        times[name[1:]] = int(cumulative)
+    return times
+
+
+def test_cli_avoids_heavy_imports():
+    """Test that differentiating one expression skips the heavy imports"""
+    times = cli_import_times("x^2")
+
+    imported = {name.strip() for name in times}
+    assert "symdiff.core" in imported
+    for module in AVOIDED_MODULES:
+        assert module not in imported
+
+
+@pytest.mark.skipif(IMPORT_TIME_BUDGET_US == 0, reason="import time budget disabled")
+def test_cli_import_time_budget():
+    """Test that differentiating one expression stays within the start-up budget"""
+
+    def total_import_time() -> int:
+        times = cli_import_times("x^2")
+        return sum(time for name, time in times.items() if not name.startswith(" "))
+
+    fastest = min(total_import_time() for _ in range(IMPORT_TIME_RUNS))
+    assert fastest <= IMPORT_TIME_BUDGET_US
+
+
+def test_parse_args_fast():
+    """Test the argparse-free argument parser"""
+    assert parse_args_fast([]) == (None, "x")
+    assert parse_args_fast(["x^2"]) == ("x^2", "x")
+    assert parse_args_fast(["y^3", "-v", "y"]) == ("y^3", "y")
+    assert parse_args_fast(["-v", "y", "y^3"]) == ("y^3", "y")
+    assert parse_args_fast(["--variable", "y", "y^3"]) == ("y^3", "y")
+    assert parse_args_fast(["--variable=y", "y^3"]) == ("y^3", "y")
+
+    assert parse_args_fast(["-h"]) is None
+    assert parse_args_fast(["-x^2"]) is None
+    assert parse_args_fast(["x", "y"]) is None
+    assert parse_args_fast(["x", "-v"]) is None
+
+
+def test_parse_args_fallback():
+    """Test that the argparse fallback agrees with the fast parser"""
+    assert parse_args(["y^3", "-v", "y"]) == ("y^3", "y")
+    assert parse_args(["-vy", "y^3"]) == ("y^3", "y")
+
+    with pytest.raises(SystemExit):
+        parse_args(["x", "y"])
+
+
+def test_cli_expression(monkeypatch, capsys):
+    """Test differentiating a single expression from the command line"""
+    monkeypatch.setattr(sys, "argv", ["symdiff", "y^3 + 2*y", "-v", "y"])
+    cli()
+    assert capsys.readouterr().out == "d/dy(y^3 + 2*y) = 3*y^2 + 2\n"
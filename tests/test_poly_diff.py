@@ -1,4 +1,8 @@
+import pytest
+
+from symdiff import core
 from symdiff.core import differentiate
+from symdiff.expressions import Power, Sum
 
 
 def test_constant_differentiation():
@@ -94,3 +98,104 @@ def test_negative_exponents():
     assert str(differentiate("2*x^-1")) == "-2*x^-2"
     assert str(differentiate("x^-3 + x^2")) == "-3*x^-4 + 2*x"
     assert str(differentiate("x^-0.5")) == "-0.5*x^-1.5"
+
+
+def test_lazy_matches_eager():
+    """Test that lazy derivatives render the same as eager ones"""
+    expressions = [
+        "5",
+        "x^2 + 2*x + 1",
+        "x^3 - 3*x^2 + 3*x - 1",
+        "0.5*x^3 + 1.5*x^2 - 0.1*x^9",
+        "x^-3 + x^2",
+        "-3*x^2",
+    ]
+    for expression in expressions:
+        assert str(differentiate(expression, lazy=True)) == str(
+            differentiate(expression)
+        )
+    assert str(differentiate("x*y^2 + y*z^2", variable="y", lazy=True)) == (
+        "x*2*y + z^2"
+    )
+
+
+def test_lazy_queries():
+    """Test the cheap queries on lazy derivatives"""
+    zero = differentiate("x^0 + 5 - y", lazy=True)
+    assert zero.is_zero
+    assert zero.degree is None
+    assert zero.term_count == 0
+
+    derivative = differentiate("x^-1 + 2*x^3 + 7", lazy=True)
+    assert not derivative.is_zero
+    assert derivative.degree == 2
+    assert derivative.term_count == 2
+
+    assert differentiate("x*x", lazy=True).term_count == 2
+    assert differentiate("-x*x", lazy=True).term_count == 2
+    assert differentiate("-x*x*x", lazy=True).term_count == 3
+    assert differentiate("-x*x + 3*x^2", lazy=True).term_count == 3
+    assert differentiate("-x*x*x", lazy=True).degree == 2
+    assert differentiate("x^2.5", lazy=True).degree == 1.5
+
+
+def test_lazy_on_demand(monkeypatch):
+    """Test that lazy derivatives only differentiate the terms they need"""
+    differentiated = []
+    power_differentiate = Power.differentiate
+
+    def counting_differentiate(self, variable):
+        differentiated.append(str(self))
+        return power_differentiate(self, variable)
+
+    monkeypatch.setattr(Power, "differentiate", counting_differentiate)
+
+    derivative = differentiate("x^2 + x^3 + x^4", lazy=True)
+    assert differentiated == []
+
+    assert not derivative.is_zero
+    assert differentiated == ["x^2"]
+
+    assert str(derivative.term(2)) == "4*x^3"
+    assert differentiated == ["x^2", "x^4"]
+
+    assert derivative.term_count == 3
+    assert str(derivative) == "2*x + 3*x^2 + 4*x^3"
+    assert differentiated == ["x^2", "x^4", "x^3"]
+
+
+def test_lazy_string_cache(monkeypatch):
+    """Test that lazy derivatives are formatted and rendered only once"""
+    formatted = []
+    format_result = core.format_result
+
+    def counting_format_result(expr):
+        formatted.append(expr)
+        return format_result(expr)
+
+    rendered = []
+    sum_str = Sum.__str__
+
+    def counting_sum_str(self):
+        rendered.append(self)
+        return sum_str(self)
+
+    monkeypatch.setattr(core, "format_result", counting_format_result)
+    monkeypatch.setattr(Sum, "__str__", counting_sum_str)
+
+    derivative = differentiate("x^2 + x^3", lazy=True)
+    assert derivative.term_count == 2
+    assert formatted == []
+    assert rendered == []
+
+    assert str(derivative) == "2*x + 3*x^2"
+    renders = len(rendered)
+    assert str(derivative) == "2*x + 3*x^2"
+    assert len(formatted) == 1
+    assert len(rendered) == renders
+
+
+def test_lazy_invalid_expression():
+    """Test that lazy differentiation still rejects invalid input up front"""
+    with pytest.raises(ValueError):
+        differentiate("x^2 + $", lazy=True)